@@ -6,10 +6,13 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.figure_factory as ff
 
-df = pd.read_csv('athlete_events.csv')
-region_df = pd.read_csv('noc_regions.csv')
+@st.cache(allow_output_mutation=True)
+def load_data():
+    df = pd.read_csv('athlete_events.csv')
+    region_df = pd.read_csv('noc_regions.csv')
+    return preprocessor.preprocess(df,region_df)
 
-df = preprocessor.preprocess(df,region_df)
+df = load_data()
 
 st.sidebar.title("Olympics Analysis")
 st.sidebar.image('https://e7.pngegg.com/pngimages/1020/402/png-clipart-2024-summer-olympics-brand-circle-area-olympic-rings-olympics-logo-text-sport.png')
@@ -37,12 +40,13 @@ if user_menu == 'Medal Tally':
     st.table(medal_tally)
 
 if user_menu == 'Overall Analysis':
-    editions = df['Year'].unique().shape[0] - 1
-    cities = df['City'].unique().shape[0]
-    sports = df['Sport'].unique().shape[0]
-    events = df['Event'].unique().shape[0]
-    athletes = df['Name'].unique().shape[0]
-    nations = df['region'].unique().shape[0]
+    counts = df[['Year', 'City', 'Sport', 'Event', 'Name', 'region']].nunique(dropna=False)
+    editions = counts['Year'] - 1
+    cities = counts['City']
+    sports = counts['Sport']
+    events = counts['Event']
+    athletes = counts['Name']
+    nations = counts['region']
 
     st.title("Top Statistics")
     col1,col2,col3 = st.beta_columns(3)
@@ -84,7 +88,7 @@ if user_menu == 'Overall Analysis':
 
     st.title("No. of Events over time(Every Sport)")
     fig,ax = plt.subplots(figsize=(20,20))
-    x = df.drop_duplicates(['Year', 'Sport', 'Event'])
+    x = df[['Year', 'Sport', 'Event']].drop_duplicates()
     ax = sns.heatmap(x.pivot_table(index='Sport', columns='Year', values='Event', aggfunc='count').fillna(0).astype('int'),
                 annot=True)
     st.pyplot(fig)
@@ -146,9 +150,10 @@ if user_menu == 'Athlete wise Analysis':
                      'Volleyball', 'Synchronized Swimming', 'Table Tennis', 'Baseball',
                      'Rhythmic Gymnastics', 'Rugby Sevens',
                      'Beach Volleyball', 'Triathlon', 'Rugby', 'Polo', 'Ice Hockey']
+    gold_df = athlete_df[athlete_df['Medal'] == 'Gold']
+    gold_ages = dict(list(gold_df.groupby('Sport')['Age']))
     for sport in famous_sports:
-        temp_df = athlete_df[athlete_df['Sport'] == sport]
-        x.append(temp_df[temp_df['Medal'] == 'Gold']['Age'].dropna())
+        x.append(gold_ages.get(sport, gold_df['Age'].iloc[:0]).dropna())
         name.append(sport)
 
     fig = ff.create_distplot(x, name, show_hist=False, show_rug=False)
@@ -162,13 +167,13 @@ if user_menu == 'Athlete wise Analysis':
 
     st.title('Height Vs Weight')
     selected_sport = st.selectbox('Select a Sport', sport_list)
-    temp_df = helper.weight_v_height(df,selected_sport)
+    temp_df = helper.weight_v_height(athlete_df,selected_sport)
     fig,ax = plt.subplots()
     ax = sns.scatterplot(temp_df['Weight'],temp_df['Height'],hue=temp_df['Medal'],style=temp_df['Sex'],s=60)
     st.pyplot(fig)
 
     st.title("Men Vs Women Participation Over the Years")
-    final = helper.men_vs_women(df)
+    final = helper.men_vs_women(athlete_df)
     fig = px.line(final, x="Year", y=["Male", "Female"])
     fig.update_layout(autosize=False, width=1000, height=600)
     st.plotly_chart(fig)
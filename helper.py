@@ -2,30 +2,22 @@ import numpy as np
 
 
 def fetch_medal_tally(df, year, country):
-    medal_df = df.drop_duplicates(subset=['Team', 'NOC', 'Games', 'Year', 'City', 'Sport', 'Event', 'Medal'])
-    flag = 0
-    if year == 'Overall' and country == 'Overall':
-        temp_df = medal_df
+    temp_df = df
+    if year != 'Overall':
+        temp_df = temp_df[temp_df['Year'] == int(year)]
+    if country != 'Overall':
+        temp_df = temp_df[temp_df['region'] == country]
+    temp_df = temp_df.drop_duplicates(subset=['Team', 'NOC', 'Games', 'Year', 'City', 'Sport', 'Event', 'Medal'])
+
     if year == 'Overall' and country != 'Overall':
-        flag = 1
-        temp_df = medal_df[medal_df['region'] == country]
-    if year != 'Overall' and country == 'Overall':
-        temp_df = medal_df[medal_df['Year'] == int(year)]
-    if year != 'Overall' and country != 'Overall':
-        temp_df = medal_df[(medal_df['Year'] == year) & (medal_df['region'] == country)]
-
-    if flag == 1:
-        x = temp_df.groupby('Year').sum()[['Gold', 'Silver', 'Bronze']].sort_values('Year').reset_index()
+        x = temp_df.groupby('Year')[['Gold', 'Silver', 'Bronze']].sum().sort_values('Year').reset_index()
     else:
-        x = temp_df.groupby('region').sum()[['Gold', 'Silver', 'Bronze']].sort_values('Gold',
+        x = temp_df.groupby('region')[['Gold', 'Silver', 'Bronze']].sum().sort_values('Gold',
                                                                                       ascending=False).reset_index()
 
     x['total'] = x['Gold'] + x['Silver'] + x['Bronze']
 
-    x['Gold'] = x['Gold'].astype('int')
-    x['Silver'] = x['Silver'].astype('int')
-    x['Bronze'] = x['Bronze'].astype('int')
-    x['total'] = x['total'].astype('int')
+    x[['Gold', 'Silver', 'Bronze', 'total']] = x[['Gold', 'Silver', 'Bronze', 'total']].astype('int')
 
     return x
 
@@ -36,7 +28,6 @@ def country_year_list(df):
     years.insert(0, 'Overall')
 
     country = np.unique(df['region'].dropna().values).tolist()
-    country.sort()
     country.insert(0, 'Overall')
 
     return years,country
@@ -54,36 +45,33 @@ def most_successful(df, sport):
     if sport != 'Overall':
         temp_df = temp_df[temp_df['Sport'] == sport]
 
-    x = temp_df['Name'].value_counts().reset_index().head(15).merge(df, left_on='index', right_on='Name', how='left')[
+    top = temp_df['Name'].value_counts().reset_index().head(15)
+    x = top.merge(df[df['Name'].isin(top['index'])][['Name', 'Sport', 'region']], left_on='index', right_on='Name', how='left')[
         ['index', 'Name_x', 'Sport', 'region']].drop_duplicates('index')
     x.rename(columns={'index': 'Name', 'Name_x': 'Medals'}, inplace=True)
     return x
 
 def yearwise_medal_tally(df,country):
-    temp_df = df.dropna(subset=['Medal'])
-    temp_df.drop_duplicates(subset=['Team', 'NOC', 'Games', 'Year', 'City', 'Sport', 'Event', 'Medal'], inplace=True)
+    temp_df = df[df['region'] == country].dropna(subset=['Medal'])
+    new_df = temp_df.drop_duplicates(subset=['Team', 'NOC', 'Games', 'Year', 'City', 'Sport', 'Event', 'Medal'])
 
-    new_df = temp_df[temp_df['region'] == country]
-    final_df = new_df.groupby('Year').count()['Medal'].reset_index()
+    final_df = new_df.groupby('Year')['Medal'].count().reset_index()
 
     return final_df
 
 def country_event_heatmap(df,country):
-    temp_df = df.dropna(subset=['Medal'])
-    temp_df.drop_duplicates(subset=['Team', 'NOC', 'Games', 'Year', 'City', 'Sport', 'Event', 'Medal'], inplace=True)
-
-    new_df = temp_df[temp_df['region'] == country]
+    temp_df = df[df['region'] == country].dropna(subset=['Medal'])
+    new_df = temp_df.drop_duplicates(subset=['Team', 'NOC', 'Games', 'Year', 'City', 'Sport', 'Event', 'Medal'])
 
     pt = new_df.pivot_table(index='Sport', columns='Year', values='Medal', aggfunc='count').fillna(0)
     return pt
 
 
 def most_successful_countrywise(df, country):
-    temp_df = df.dropna(subset=['Medal'])
-
-    temp_df = temp_df[temp_df['region'] == country]
+    temp_df = df[df['region'] == country].dropna(subset=['Medal'])
 
-    x = temp_df['Name'].value_counts().reset_index().head(10).merge(df, left_on='index', right_on='Name', how='left')[
+    top = temp_df['Name'].value_counts().reset_index().head(10)
+    x = top.merge(df[df['Name'].isin(top['index'])][['Name', 'Sport']], left_on='index', right_on='Name', how='left')[
         ['index', 'Name_x', 'Sport']].drop_duplicates('index')
     x.rename(columns={'index': 'Name', 'Name_x': 'Medals'}, inplace=True)
     return x
@@ -100,8 +88,8 @@ def weight_v_height(df,sport):
 def men_vs_women(df):
     athlete_df = df.drop_duplicates(subset=['Name', 'region'])
 
-    men = athlete_df[athlete_df['Sex'] == 'M'].groupby('Year').count()['Name'].reset_index()
-    women = athlete_df[athlete_df['Sex'] == 'F'].groupby('Year').count()['Name'].reset_index()
+    men = athlete_df[athlete_df['Sex'] == 'M'].groupby('Year')['Name'].count().reset_index()
+    women = athlete_df[athlete_df['Sex'] == 'F'].groupby('Year')['Name'].count().reset_index()
 
     final = men.merge(women, on='Year', how='left')
     final.rename(columns={'Name_x': 'Male', 'Name_y': 'Female'}, inplace=True)